@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
+import sys
+
 from polyglot import arguments, polyglot
+from polyglot.errors import PolyglotError
 
 
 def main() -> None:
@@ -10,6 +13,9 @@ def main() -> None:
         polyglot.Polyglot(options).execute_command()
     except KeyboardInterrupt:
         print("\n\nInterrupted by user.")
+    except PolyglotError as error:
+        print(error)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
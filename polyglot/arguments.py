@@ -1,4 +1,5 @@
 import argparse
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
@@ -44,7 +45,7 @@ class CLIArgumentsCollector(ArgumentsCollector):
     __namespace: argparse.Namespace
 
     def _collect_arguments(self) -> None:
-        self.__set_parser()
+        self.__parser = self.__build_parser()
         self.__namespace = self.__parser.parse_args()
         self.arguments = Arguments(
             action=self.__namespace.action,
@@ -61,7 +62,9 @@ class CLIArgumentsCollector(ArgumentsCollector):
         ):
             self.__parser.error("translate requires --source_file and --target_lang.")
 
-    def __set_parser(self) -> None:
+    @staticmethod
+    @functools.cache
+    def __build_parser() -> argparse.ArgumentParser:
 
         parser: argparse.ArgumentParser = argparse.ArgumentParser(
             description="Polyglot will translate the given files."
@@ -105,4 +108,4 @@ class CLIArgumentsCollector(ArgumentsCollector):
             help="Source file language code. Detected automatically by DeepL by default. Specifying it can increase performance and make translations more accurate.",
             default="",
         )
-        self.__parser = parser
+        return parser
@@ -3,20 +3,34 @@ import requests
 import json
 import colorama
 import urllib.parse
+from typing import Iterator
+from requests.adapters import HTTPAdapter
 from requests.models import Response
+from urllib3.util.retry import Retry
 
 import polyglot
 from polyglot import license
 from polyglot.errors import DeeplError
 from polyglot.utilities import get_color_by_percentage, get_truncated_text
 
+# * DeepL accepts up to 50 text parameters per translation request
+TEXTS_PER_REQUEST_LIMIT: int = 50
+# * Request bodies are limited to 128 KiB, room is left for the other parameters
+TEXTS_SIZE_LIMIT: int = 120 * 1024
+
+
+def get_text_size(entry: str) -> int:
+    return len(urllib.parse.urlencode({"text": entry})) + 1
+
 
 class Deepl:
 
     __LEN_LIMIT: int = 150
+    __CHUNK_SIZE: int = 1024 * 1024
 
     __license: license.License
     __license_manager: license.LicenseManager
+    __session: requests.Session
 
     def __init__(
         self,
@@ -24,6 +38,30 @@ class Deepl:
     ) -> None:
         self.__license_manager = license_manager
         self.__license = self.__license_manager.get_license()
+        # * A single session keeps connections alive across (threaded) requests
+        self.__session = requests.Session()
+        # * 429 means the request was rejected, so any call can be sent again
+        self.__session.mount("https://", self.__get_adapter([429]))
+        # * Text translation is idempotent, server errors can be retried too.
+        # * Document uploads are not: a retried upload could start a second job
+        self.__session.mount(
+            f"{self.__base_url}translate",
+            self.__get_adapter([429, 500, 502, 503, 504]),
+        )
+
+    def __get_adapter(self, status_forcelist: list[int]) -> HTTPAdapter:
+        retry: Retry = Retry(
+            total=3,
+            # * A read error may come after DeepL received the request
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=status_forcelist,
+            # * Retries are limited by status, POST requests included
+            allowed_methods=None,
+            # * The last response is returned so DeeplError can report its status
+            raise_on_status=False,
+        )
+        return HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
 
     @property
     def __base_url(self) -> str:
@@ -38,7 +76,7 @@ class Deepl:
         }
 
     def __get_usage_info(self) -> Response:
-        return requests.get(f"{self.__base_url}usage", headers=self.__headers)
+        return self.__session.get(f"{self.__base_url}usage", headers=self.__headers)
 
     def print_usage_info(self) -> None:
         response: Response = self.__get_usage_info()
@@ -59,7 +97,7 @@ class Deepl:
             )
 
     def print_supported_languages(self) -> None:
-        response: Response = requests.get(
+        response: Response = self.__session.get(
             f"{self.__base_url}languages", headers=self.__headers
         )
 
@@ -76,44 +114,67 @@ class Deepl:
             )
 
     def translate(self, entry: str, target_lang: str, source_lang: str = "") -> str:
+        return self.translate_many([entry], target_lang, source_lang)[0]
 
-        escaped_entry: str = urllib.parse.quote(entry)
-        endpoint: str = f"{self.__base_url}translate?auth_key={self.__license.key}&text={escaped_entry}&target_lang={target_lang}"
+    def translate_many(
+        self, entries: list[str], target_lang: str, source_lang: str = ""
+    ) -> list[str]:
+        request_data: list[tuple[str, str]] = [
+            ("auth_key", self.__license.key),
+            ("target_lang", target_lang),
+        ]
 
         if source_lang != "":
-            endpoint += f"&source_lang={source_lang}"
+            request_data.append(("source_lang", source_lang))
 
-        response: Response = requests.get(endpoint)
-        truncated_text: str = get_truncated_text(entry, self.__LEN_LIMIT)
+        request_data.extend(("text", entry) for entry in entries)
+
+        response: Response = self.__session.post(
+            f"{self.__base_url}translate", data=request_data
+        )
+        truncated_text: str = get_truncated_text(entries[0], self.__LEN_LIMIT)
+        request_description: str = (
+            f'"{truncated_text}"'
+            if len(entries) == 1
+            else f'a batch of {len(entries)} texts starting with "{truncated_text}"'
+        )
 
         try:
 
             body: dict = json.loads(response.text)
-            translation: str = body["translations"][0]["text"]
-
-            truncated_translation: str = get_truncated_text(
-                translation, self.__LEN_LIMIT
-            )
-            print(f'"{truncated_text}" => "{truncated_translation}"')
-            return translation
+            translations: list[str] = [
+                translation["text"] for translation in body["translations"]
+            ]
 
         except KeyError:
             message: str = json.loads(response.text)["message"]
             if message:
                 raise DeeplError(
                     status_code=response.status_code,
-                    message=f'Error translating "{truncated_text}". Message: {message}"\n',
+                    message=f'Error translating {request_description}. Message: {message}"\n',
                 )
-            print(
-                f'{colorama.Fore.YELLOW}\nNo traslation found for "{truncated_text}"!\n'
-            )
+            translations = [""] * len(entries)
 
         except:
             raise DeeplError(
                 status_code=response.status_code,
-                message=f'Error translating "{truncated_text}".\n',
+                message=f"Error translating {request_description}.\n",
             )
-        return ""
+
+        for entry, translation in zip(entries, translations):
+            truncated_entry: str = get_truncated_text(entry, self.__LEN_LIMIT)
+
+            if translation:
+                truncated_translation: str = get_truncated_text(
+                    translation, self.__LEN_LIMIT
+                )
+                print(f'"{truncated_entry}" => "{truncated_translation}"')
+            else:
+                print(
+                    f'{colorama.Fore.YELLOW}\nNo traslation found for "{truncated_entry}"!\n'
+                )
+
+        return translations
 
     def translate_document(
         self, source_file: str, target_lang: str, source_lang: str = ""
@@ -130,7 +191,7 @@ class Deepl:
         endpoint: str = f"{self.__base_url}document/"
 
         with open(source_file, "rb") as document:
-            response: Response = requests.post(
+            response: Response = self.__session.post(
                 endpoint, data=request_data, files={"file": document}
             )
 
@@ -146,7 +207,7 @@ class Deepl:
         self, document_id: str, document_key: str
     ) -> dict[str, str]:
         endpoint: str = f"{self.__base_url}document/{document_id}?auth_key={self.__license.key}&document_key={document_key}"
-        response: Response = requests.post(endpoint)
+        response: Response = self.__session.post(endpoint)
 
         if response.status_code == 200:
             return json.loads(response.text)
@@ -158,13 +219,23 @@ class Deepl:
 
     def download_translated_document(
         self, document_id: str, document_key: str
-    ) -> bytes:
+    ) -> Iterator[bytes]:
         endpoint: str = f"{self.__base_url}document/{document_id}/result?auth_key={self.__license.key}&document_key={document_key}"
-        response: Response = requests.post(endpoint)
+        response: Response = self.__session.post(endpoint, stream=True)
 
         if response.status_code == 200:
-            return response.content
+            return self.__iter_document_content(response)
 
         raise DeeplError(
             status_code=response.status_code, message="Error downlaoding a document."
         )
+
+    def __iter_document_content(self, response: Response) -> Iterator[bytes]:
+        # * The body is read while the caller writes it, so errors surface here
+        try:
+            yield from response.iter_content(chunk_size=self.__CHUNK_SIZE)
+        except requests.RequestException:
+            raise DeeplError(
+                status_code=response.status_code,
+                message="Error downloading a document.",
+            )
@@ -1,7 +1,11 @@
 import colorama
 
 
-class DeeplError(Exception):
+class PolyglotError(Exception):
+    pass
+
+
+class DeeplError(PolyglotError):
     status_code: int
     message: str
 
@@ -15,7 +19,7 @@ class DeeplError(Exception):
         )
 
 
-class HandlerError(Exception):
+class HandlerError(PolyglotError):
     source_file: str
     message: str
 
@@ -25,3 +29,13 @@ class HandlerError(Exception):
         super().__init__(
             f"\n\n{colorama.Fore.RED}Cannot read {self.source_file}.\nMessage: {message}.\n"
         )
+
+
+class DocumentError(PolyglotError):
+    message: str
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(
+            f"\n\n{colorama.Fore.RED}Cannot translate the document.\nMessage: {message}.\n"
+        )
@@ -1,11 +1,14 @@
-import json
+import orjson
 import os
 import polib
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator
 
 from polyglot.errors import HandlerError
 
+BUFFER_SIZE: int = 1024 * 1024
+
+
 # TODO: Check if the file is empty
 def verfiy_source(function: Any) -> Any:
     def function_wrapper(instance: FileHandler):
@@ -22,6 +25,7 @@ def verfiy_source(function: Any) -> Any:
 class FileHandler(ABC):
 
     source_file: str
+    _extension: str
     _target_file: str
 
     def __init__(
@@ -29,21 +33,18 @@ class FileHandler(ABC):
     ) -> None:
         self.source_file = source_file
         self.target_lang = target_lang
+        self._extension = os.path.splitext(source_file)[1]
         self.__set_target_file(output_directory, target_lang)
 
-    @property
-    def _extension(self) -> str:
-        return os.path.splitext(self.source_file)[1]
-
     def __set_target_file(self, output_directory: str, target_lang: str) -> None:
         output_directory = (
             output_directory
             if output_directory != "" and os.path.isdir(output_directory)
             else os.getcwd()
         )
-        if output_directory[-1] == "/":
-            output_directory = output_directory[:-1]
-        self._target_file = f"{output_directory}/{target_lang.lower()}{self._extension}"
+        self._target_file = os.path.join(
+            output_directory, f"{target_lang.lower()}{self._extension}"
+        )
 
     @abstractmethod
     def read(self) -> Any:
@@ -57,11 +58,15 @@ class FileHandler(ABC):
 class TextHandler(FileHandler):
     @verfiy_source
     def read(self) -> str:
-        with open(self.source_file, "r") as source:
+        with open(
+            self.source_file, "r", encoding="utf-8", buffering=BUFFER_SIZE
+        ) as source:
             return source.read()
 
     def write(self, translated_content: str) -> None:
-        with open(self._target_file, "w+") as destination:
+        with open(
+            self._target_file, "w+", encoding="utf-8", buffering=BUFFER_SIZE
+        ) as destination:
             destination.write(translated_content)
             print(f"Generated {self._target_file}.")
 
@@ -69,48 +74,66 @@ class TextHandler(FileHandler):
 class JSONHandler(FileHandler):
     @verfiy_source
     def read(self) -> dict:
-        with open(self.source_file, "r") as source:
-            return json.load(source)
+        with open(self.source_file, "rb", buffering=BUFFER_SIZE) as source:
+            return orjson.loads(source.read())
 
     def write(self, translated_content: dict) -> None:
-        with open(self._target_file, "w+") as destination:
-            destination.write(json.dumps(translated_content, indent=2))
+        with open(self._target_file, "wb+", buffering=BUFFER_SIZE) as destination:
+            destination.write(
+                orjson.dumps(translated_content, option=orjson.OPT_INDENT_2)
+            )
             print(f"Generated {self._target_file}.")
 
 
 class POHandler(FileHandler):
 
-    __content: dict[str, Any] = {}
+    __metadata: dict[str, str]
+    __entries: list[tuple[str, str, list[tuple[str, str]]]]
+
+    def __init__(
+        self, source_file: str, output_directory: str, target_lang: str
+    ) -> None:
+        super().__init__(source_file, output_directory, target_lang)
+        self.__metadata = {}
+        self.__entries = []
 
     @verfiy_source
     def read(self) -> dict:
 
-        pofile: polib.POFile = self.__pofile_source
+        pofile: polib.POFile = polib.pofile(self.source_file)
         translatables: dict[str, str] = {}
 
+        self.__metadata = pofile.metadata
+
+        positions: dict[str, int] = {}
+
         for entry in pofile:
             message: str = entry.msgid if entry.msgstr == "" else entry.msgstr
-            self.__content[entry.msgid] = {
-                "msgstr": message,
-                "occurrences": entry.occurrences,
-            }
+
+            # * One entry per msgid: a repeated msgid replaces the earlier one in place
+            if entry.msgid in positions:
+                self.__entries[positions[entry.msgid]] = (
+                    entry.msgid,
+                    message,
+                    entry.occurrences,
+                )
+            else:
+                positions[entry.msgid] = len(self.__entries)
+                self.__entries.append((entry.msgid, message, entry.occurrences))
+
             translatables[entry.msgid] = message
 
         return translatables
 
-    @property
-    def __pofile_source(self) -> polib.POFile:
-        return polib.pofile(self.source_file)
-
     def write(self, translated_content: dict[str, str]) -> None:
         pofile: polib.POFile = polib.POFile()
-        pofile.metadata = self.__pofile_source.metadata
-
-        self.__update_content(translated_content)
+        pofile.metadata = self.__metadata
 
-        for key, value in self.__content.items():
+        for msgid, message, occurrences in self.__entries:
             entry: polib.POEntry = polib.POEntry(
-                msgid=key, msgstr=value["msgstr"], occurrences=value["occurrences"]
+                msgid=msgid,
+                msgstr=translated_content.get(msgid, message),
+                occurrences=occurrences,
             )
             pofile.append(entry)
 
@@ -120,10 +143,6 @@ class POHandler(FileHandler):
 
         print(f"Generated {self._target_file} and {mofile_path}.")
 
-    def __update_content(self, translated_content: dict[str, str]) -> None:
-        for key, value in translated_content.items():
-            self.__content[key]["msgstr"] = value
-
 
 class DocumentHandler(FileHandler):
     @verfiy_source
@@ -131,7 +150,18 @@ class DocumentHandler(FileHandler):
         with open(self.source_file, "r") as source:
             return self.source_file
 
-    def write(self, translated_content: bytes) -> None:
-        with open(self._target_file, "wb+") as destination:
-            destination.write(translated_content)
-            print(f"Generated {self._target_file}.")
+    def write(self, translated_content: Iterator[bytes]) -> None:
+        # * A download that fails halfway must not leave a truncated target file
+        temporary_file: str = f"{self._target_file}.part"
+
+        try:
+            with open(temporary_file, "wb+", buffering=BUFFER_SIZE) as destination:
+                for chunk in translated_content:
+                    destination.write(chunk)
+            os.replace(temporary_file, self._target_file)
+        except:
+            if os.path.exists(temporary_file):
+                os.remove(temporary_file)
+            raise
+
+        print(f"Generated {self._target_file}.")
@@ -1,11 +1,15 @@
 import asyncio
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
 
 import colorama
 import progressbar
 
 from polyglot import deepl
+from polyglot.errors import DocumentError
+from polyglot.utilities import is_translatable
 
 
 class Translator(ABC):
@@ -33,47 +37,116 @@ class TextTranslator(Translator):
 
 class DictionaryTranslator(Translator):
 
+    __MAX_WORKERS: int = 16
+
     __progress_bar: progressbar.ProgressBar
-    __completion_count: int = 0
-    __not_translated_entries: list[str] = []
+    __progress_lock: threading.Lock
+    __completion_count: int
+    __not_translated_entries: list[str]
+
+    def __init__(
+        self, target_lang: str, source_lang: str, dispatcher: deepl.Deepl
+    ) -> None:
+        super().__init__(target_lang, source_lang, dispatcher)
+        self.__progress_lock = threading.Lock()
+        self.__completion_count = 0
+        self.__not_translated_entries = []
 
     def translate(self, content: dict) -> dict:
-        self.__set_progress_bar(content)
         self.__translate_dictionary(content)
         self.__print_messages()
         return content
 
-    def __set_progress_bar(self, content: dict) -> None:
-        number_of_translations: int = self.__get_number_of_translations(content)
+    def __set_progress_bar(self, number_of_translations: int) -> None:
         self.__progress_bar = progressbar.ProgressBar(
             max_value=number_of_translations, redirect_stdout=True
         )
 
-    def __get_number_of_translations(self, dictionary: dict) -> int:
-        return sum(
-            self.__get_number_of_translations(value) if isinstance(value, dict) else 1
-            for key, value in dictionary.items()
+    def __translate_dictionary(self, dictionary: dict) -> None:
+        entries: list[tuple[dict, Any, str]] = self.__get_entries(dictionary)
+        translations: dict[str, str] = self.__translate_values(
+            [value for _, _, value in entries]
         )
 
-    def __translate_dictionary(self, dictionary: dict) -> None:
+        for parent, key, value in entries:
+            parent[key] = translations[value]
+
+    def __translate_values(self, values: list[str]) -> dict[str, str]:
+        # * Strings without words (blanks, numbers, placeholders...) skip the API
+        translations: dict[str, str] = {
+            value: value for value in values if not is_translatable(value)
+        }
+        # * Each distinct string is sent only once, no matter how often it occurs
+        unique_values: list[str] = list(
+            dict.fromkeys(value for value in values if value not in translations)
+        )
+        batches: list[list[str]] = self.__get_batches(unique_values)
+        self.__set_progress_bar(len(unique_values))
+
+        with ThreadPoolExecutor(max_workers=self.__MAX_WORKERS) as executor:
+            results: Iterator[list[str]] = executor.map(self.__translate_batch, batches)
+
+            for batch, batch_translations in zip(batches, results):
+                for value, translation in zip(batch, batch_translations):
+                    if not translation:
+                        self.__not_translated_entries.append(value)
+                    translations[value] = translation if translation else value
+
+        return translations
 
-        for key, value in dictionary.items():
+    def __get_entries(self, dictionary: dict) -> list[tuple[dict, Any, str]]:
+        # * Iterative walk: deep files cannot hit the recursion limit
+        entries: list[tuple[dict, Any, str]] = []
+        stack: list[tuple[dict, Iterator]] = [(dictionary, iter(dictionary.items()))]
 
-            if isinstance(value, dict):
-                self.__translate_dictionary(value)
+        while stack:
+            parent, items = stack[-1]
+
+            for key, value in items:
+                if isinstance(value, dict):
+                    stack.append((value, iter(value.items())))
+                    break
+                entries.append((parent, key, value))
 
             else:
-                dictionary[key] = self.__translate_entry(value)
-                self.__completion_count += 1
-                self.__progress_bar.update(self.__completion_count)
+                stack.pop()
+
+        return entries
+
+    def __get_batches(self, values: list[str]) -> list[list[str]]:
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        batch_size: int = 0
 
-    def __translate_entry(self, entry: str) -> str:
-        translation: str = self._dispatcher.translate(
-            entry, self._target_lang, self._source_lang
+        for value in values:
+            value_size: int = deepl.get_text_size(value)
+
+            if batch and (
+                len(batch) == deepl.TEXTS_PER_REQUEST_LIMIT
+                or batch_size + value_size > deepl.TEXTS_SIZE_LIMIT
+            ):
+                batches.append(batch)
+                batch = []
+                batch_size = 0
+
+            batch.append(value)
+            batch_size += value_size
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def __translate_batch(self, batch: list[str]) -> list[str]:
+        translations: list[str] = self._dispatcher.translate_many(
+            batch, self._target_lang, self._source_lang
         )
-        if not translation:
-            self.__not_translated_entries.append(entry)
-        return translation if translation else entry
+
+        with self.__progress_lock:
+            self.__completion_count += len(batch)
+            self.__progress_bar.update(self.__completion_count)
+
+        return translations
 
     def __print_messages(self) -> None:
         print("\nTranslation completed.")
@@ -87,11 +160,13 @@ class DictionaryTranslator(Translator):
 
 class DocumentTranslator(Translator):
 
+    __MAX_POLLING_INTERVAL: int = 30
+
     __document_id: str
     __document_key: str
-    __translated_file: bytes
+    __translated_file: Iterator[bytes]
 
-    def translate(self, content: str) -> bytes:
+    def translate(self, content: str) -> Iterator[bytes]:
         document_data: dict[str, str] = self._dispatcher.translate_document(
             content, self._target_lang, self._source_lang
         )
@@ -101,24 +176,37 @@ class DocumentTranslator(Translator):
         return self.__translated_file
 
     async def __download_document_when_ready(self) -> None:
-        status_data = self._dispatcher.check_document_status(
-            self.__document_id, self.__document_key
-        )
-        status: str = status_data["status"]
-
-        if status == "done":
-            billed_characters: str = status_data["billed_characters"]
-            print(f"Translation completed. Billed characters: {billed_characters}.")
-            self.__translated_file = self.__download_target_file()
-            return
+        polling_interval: int = 1
 
-        # * sometimes there are no seconds even if it's still translating
-        if "seconds_remaining" in status_data:
-            print(f'Remaining {status_data["seconds_remaining"]} seconds...')
-
-        await self.__download_document_when_ready()
+        while True:
+            status_data = self._dispatcher.check_document_status(
+                self.__document_id, self.__document_key
+            )
+            status: str = status_data["status"]
+
+            if status == "done":
+                billed_characters: str = status_data["billed_characters"]
+                print(f"Translation completed. Billed characters: {billed_characters}.")
+                self.__translated_file = self.__download_target_file()
+                return
+
+            if status == "error":
+                raise DocumentError(status_data.get("error_message", "Unknown error"))
+
+            # * sometimes there are no seconds even if it's still translating
+            if "seconds_remaining" in status_data:
+                seconds_remaining: int = int(status_data["seconds_remaining"])
+                print(f"Remaining {seconds_remaining} seconds...")
+                await asyncio.sleep(
+                    min(max(seconds_remaining, 1), self.__MAX_POLLING_INTERVAL)
+                )
+            else:
+                await asyncio.sleep(polling_interval)
+                polling_interval = min(
+                    polling_interval * 2, self.__MAX_POLLING_INTERVAL
+                )
 
-    def __download_target_file(self) -> bytes:
+    def __download_target_file(self) -> Iterator[bytes]:
         return self._dispatcher.download_translated_document(
             self.__document_id, self.__document_key
         )
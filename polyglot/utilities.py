@@ -1,5 +1,11 @@
+import re
 import colorama
 
+# * Format placeholders ({name}, {{count}}, %s, %(name)d), HTML tags and URLs
+PLACEHOLDER_PATTERN: re.Pattern = re.compile(
+    r"\{\{?[^{}]*\}?\}|%(\([^)]*\))?[-#0 +]*\d*(\.\d+)?[sdifeEgGxXoc%]|<[^>]*>|https?://\S+"
+)
+
 
 def get_truncated_text(text: str, limit: int) -> str:
     return text[:limit] + "..." if len(text) > limit else text
@@ -11,3 +17,7 @@ def get_color_by_percentage(percentage: int) -> str:
     if percentage > 60:
         return colorama.Fore.YELLOW
     return colorama.Fore.RESET
+
+
+def is_translatable(text: str) -> bool:
+    return any(char.isalpha() for char in PLACEHOLDER_PATTERN.sub("", text))
@@ -33,6 +33,7 @@ setup(
         "colorama",
         "polib",
         "progressbar2",
+        "orjson",
     ],
     entry_points={
         "console_scripts": [